@@ -1,14 +1,15 @@
 # File-Org-V9.py
 # File Renamer Pro v9.0
-:
+# Changes in v9:
 # - CRITICAL FIX: Excel file no longer held in limbo after operations
-#   - Cache now properly released after each operation
+#   - Parsed sheet is cached in memory only, keyed on the file's (mtime, size),
+#     so an edited/saved file is re-read automatically; no file handle is kept
+#   - Cache cleared when a new Excel file is selected and on exit
 #   - File can be opened/edited/re-run without restarting .exe
 # - CRITICAL FIX: Matching logic corrected
 #   - Always uses Current_Filename (Column B) to match files
 #   - Falls back to index-based matching ONLY if Column B is empty
 #   - Prevents renaming wrong files when reusing templates
-# - Added explicit cache invalidation on all file operations
 # - Security audit completed:
 #   - No network connections or external API calls
 #   - All file operations strictly local to target folder
@@ -24,16 +25,108 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from tkinterdnd2 import DND_FILES, TkinterDnD
 import os
+import sys
+import errno
+import ctypes
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import json
+import re
 import shutil
-import glob
+import zipfile
 import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"  # Rust-based reader, much faster than openpyxl
+    EXCEL_ENGINE_KWARGS = {}
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+    # Streaming read-only mode: rows are read lazily and the file is closed after the read
+    EXCEL_ENGINE_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
 
 APP_NAME = "File Renamer Pro v9.0"
 
+# The only 'Rename Index' columns preview/rename use - Row and any extra columns are never parsed
+RENAME_COLUMNS = ('Current_Filename', 'Prefix', 'New_Filename', 'Notes')
+
+# UNC/network prefixes (\\\\server, //server) or a '..' path component
+_UNSAFE_PATH = re.compile(r"^(?:\\\\|//)|(?:^|[\\/])\.\.(?:[\\/]|$)")
+
+_RENAME_INDEX_SHEET = re.compile(rb"""<(?:\w+:)?sheet\b[^>]*\bname=["']Rename Index["']""")
+
+def _has_rename_index(path):
+    """Check an .xlsx for a 'Rename Index' sheet by reading xl/workbook.xml straight from the zip"""
+    try:
+        with zipfile.ZipFile(path) as z:
+            return _RENAME_INDEX_SHEET.search(z.read("xl/workbook.xml")) is not None
+    except (zipfile.BadZipFile, KeyError, OSError):
+        return False
+
+def _target_conflicts(old_path, new_path):
+    """True if new_path exists and is a different file from old_path (a case-only rename is not a conflict)"""
+    try:
+        new_st = os.stat(new_path)
+    except FileNotFoundError:
+        return False
+    old_st = os.stat(old_path)
+    return (new_st.st_ino, new_st.st_dev) != (old_st.st_ino, old_st.st_dev)
+
+def _load_renameat2():
+    """libc renameat2() on Linux (glibc 2.28+), or None where it is not available"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint)
+    fn.restype = ctypes.c_int
+    return fn
+
+_renameat2 = _load_renameat2()
+_AT_FDCWD = -100
+_RENAME_NOREPLACE = 1
+
+# Whether _safe_rename itself refuses to replace an existing file: os.rename does on
+# Windows, renameat2(RENAME_NOREPLACE) does on Linux. Elsewhere a stat has to come first
+_RENAME_REFUSES_OVERWRITE = os.name == "nt" or _renameat2 is not None
+
+def _safe_rename(old_path, new_path):
+    """Rename without ever replacing an existing file; raises FileExistsError if new_path is taken"""
+    if _renameat2 is not None:
+        if _renameat2(_AT_FDCWD, os.fsencode(old_path), _AT_FDCWD, os.fsencode(new_path), _RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err == errno.EEXIST:
+            # A case-only rename on a case-insensitive mount "exists" as the file itself
+            if not _target_conflicts(old_path, new_path):
+                os.rename(old_path, new_path)
+                return
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), old_path, None, new_path)
+        # Filesystem or kernel without RENAME_NOREPLACE - check first, then plain rename
+        if _target_conflicts(old_path, new_path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), old_path, None, new_path)
+    os.rename(old_path, new_path)
+
 class FileRenamerApp:
+    # Fixed attribute layout (no per-instance __dict__) - add new attributes here
+    __slots__ = (
+        'root', 'config_file',
+        'excel_path_var', 'target_folder_var', 'file_ext', 'mode_var',
+        'backup_var', 'fast_backup_var', 'recursive_var', 'dry_run_var', 'auto_pull_var',
+        'delimiter_var', 'delimiter_choice_var',
+        '_df_cache', '_validated_sig', 'scanned_template_created',
+        'btn_blank_template', 'entry_excel', 'entry_folder',
+        'progress_frame', 'progress_var', 'progress_bar', 'status_var',
+        'btn_run', '_rename_thread', '_progress_queue', '_progress_total',
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title(APP_NAME)
@@ -49,19 +142,31 @@ class FileRenamerApp:
         self.file_ext = tk.StringVar(value=".pdf")
         self.mode_var = tk.StringVar(value="Prefix")
         self.backup_var = tk.BooleanVar(value=True)
+        self.fast_backup_var = tk.BooleanVar(value=False)
         self.recursive_var = tk.BooleanVar(value=False)
         self.dry_run_var = tk.BooleanVar(value=False)
         self.auto_pull_var = tk.BooleanVar(value=True)
         self.delimiter_var = tk.StringVar(value="-")
         self.delimiter_choice_var = tk.StringVar(value="-")
 
-        # Cached Excel data - MUST BE CLEARED after operations
-        self.cached_excel_data = None
-        self.cached_excel_path = None
+        # Parsed 'Rename Index' sheets keyed by path -> ((mtime_ns, size), DataFrame)
+        # The DataFrame is fully in memory, so no file handle is kept open
+        self._df_cache = {}
+
+        # (excel mtime, folder mtime) of the last inputs that passed validation
+        self._validated_sig = None
+        for var in (self.excel_path_var, self.target_folder_var, self.file_ext):
+            var.trace_add('write', self._invalidate_validation)
 
         # Internal flags
         self.scanned_template_created = False
 
+        # Background rename worker and the queue it reports progress through;
+        # _progress_queue stays set until _finish_rename has handled the result
+        self._rename_thread = None
+        self._progress_queue = None
+        self._progress_total = None  # maximum the progress bar is currently configured for
+
         self.load_config()
         self.setup_ui()
         self.root.minsize(980, 750)
@@ -87,6 +192,7 @@ class FileRenamerApp:
                     self.file_ext.set(cfg.get("file_ext", ".pdf"))
                     self.mode_var.set(cfg.get("mode", "Prefix"))
                     self.backup_var.set(cfg.get("backup", True))
+                    self.fast_backup_var.set(cfg.get("fast_backup", False))
                     self.recursive_var.set(cfg.get("recursive", False))
                     self.auto_pull_var.set(cfg.get("auto_pull", True))
                     self.delimiter_var.set(cfg.get("delimiter", "-"))
@@ -102,6 +208,7 @@ class FileRenamerApp:
                 "file_ext": self.file_ext.get(),
                 "mode": self.mode_var.get(),
                 "backup": self.backup_var.get(),
+                "fast_backup": self.fast_backup_var.get(),
                 "recursive": self.recursive_var.get(),
                 "auto_pull": self.auto_pull_var.get(),
                 "delimiter": self.delimiter_var.get()
@@ -112,9 +219,12 @@ class FileRenamerApp:
             pass
 
     def clear_excel_cache(self):
-        """CRITICAL: Clear cache to release Excel file lock"""
-        self.cached_excel_data = None
-        self.cached_excel_path = None
+        """Drop all parsed Excel data"""
+        self._df_cache.clear()
+        self._validated_sig = None
+
+    def _invalidate_validation(self, *_):
+        self._validated_sig = None
 
     def check_excel_available(self, excel_path):
         """Check if Excel file is accessible (not locked)"""
@@ -138,36 +248,42 @@ class FileRenamerApp:
     def validate_local_path(self, path):
         """Security: Ensure path is local and not attempting directory traversal"""
         try:
-            # Normalize path and check it's not trying to escape
+            # Normalize path and check it's not trying to escape or reach the network
             normalized = os.path.normpath(path)
-            # Check for suspicious patterns
-            if ".." in normalized or path.startswith("\\\\") or path.startswith("//"):
+            if _UNSAFE_PATH.search(normalized):
                 return False
-            # Ensure it's a local path (not network or remote)
-            if normalized.startswith("\\\\") or ":" not in normalized[:3]:
-                if not os.path.isabs(normalized):
-                    return True  # Relative paths are okay
-                return False
-            return True
+            # Local paths carry a drive letter; relative paths are okay too
+            return ":" in normalized[:3] or not os.path.isabs(normalized)
         except Exception:
             return False
 
     def read_excel_safe(self, excel_path):
         """
-        Read Excel file WITHOUT caching to prevent file lock.
-        Each read is fresh to allow Excel to be edited between operations.
+        Read the 'Rename Index' sheet, reusing the last parse while the file is unchanged.
+        The cache is keyed by (mtime, size), so saving the file in Excel invalidates it.
         """
         # Check if file is available
         available, error_msg = self.check_excel_available(excel_path)
         if not available:
             raise PermissionError(error_msg)
-        
+
+        st = os.stat(excel_path)
+        sig = (st.st_mtime_ns, st.st_size)
+        cached = self._df_cache.get(excel_path)
+        if cached is not None and cached[0] == sig:
+            return cached[1].copy()
+
+        # pandas closes the workbook once the read completes - no lock is held
         try:
-            # Read fresh every time - no caching
-            df = pd.read_excel(excel_path, sheet_name='Rename Index', dtype=str).fillna("")
-            return df
-        except Exception as e:
-            raise e
+            df = pd.read_excel(excel_path, sheet_name='Rename Index', dtype=str,
+                               engine=EXCEL_ENGINE, engine_kwargs=EXCEL_ENGINE_KWARGS,
+                               usecols=lambda col: col in RENAME_COLUMNS).fillna("")
+        except ValueError as e:
+            if 'Rename Index' in str(e):
+                raise KeyError('Sheet "Rename Index" missing') from e
+            raise
+        self._df_cache[excel_path] = (sig, df)
+        return df.copy()
 
     def setup_ui(self):
         padx = 10
@@ -271,14 +387,17 @@ class FileRenamerApp:
         chk_backup = ttk.Checkbutton(options_frame, text="✓ Create backup before renaming (RECOMMENDED)", variable=self.backup_var)
         chk_backup.grid(row=3, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
 
+        chk_fast_backup = ttk.Checkbutton(options_frame, text="Fast backup (hardlink instead of copy - same drive only)", variable=self.fast_backup_var)
+        chk_fast_backup.grid(row=4, column=0, columnspan=5, padx=padx*3, pady=pady, sticky="w")
+
         chk_recursive = ttk.Checkbutton(options_frame, text="Include subfolders (recursive)", variable=self.recursive_var)
-        chk_recursive.grid(row=4, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
+        chk_recursive.grid(row=5, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
 
         chk_dry_run = ttk.Checkbutton(options_frame, text="Dry run (preview only, don't rename)", variable=self.dry_run_var)
-        chk_dry_run.grid(row=5, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
+        chk_dry_run.grid(row=6, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
 
         chk_auto_pull = ttk.Checkbutton(options_frame, text="Auto-pull latest template from target folder", variable=self.auto_pull_var)
-        chk_auto_pull.grid(row=6, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
+        chk_auto_pull.grid(row=7, column=0, columnspan=5, padx=padx, pady=pady, sticky="w")
 
         # ---------- Progress Bar ----------
         self.progress_frame = ttk.Frame(main_frame)
@@ -304,8 +423,8 @@ class FileRenamerApp:
         btn_help = ttk.Button(button_frame, text="❓ Help", command=self.show_help, width=12)
         btn_help.pack(side="left", padx=5)
 
-        btn_run = ttk.Button(button_frame, text="▶ Run Rename", command=self.on_continue, width=16)
-        btn_run.pack(side="right", padx=5)
+        self.btn_run = ttk.Button(button_frame, text="▶ Run Rename", command=self.on_continue, width=16)
+        self.btn_run.pack(side="right", padx=5)
 
         btn_quit = ttk.Button(button_frame, text="Exit", command=self.on_quit, width=12)
         btn_quit.pack(side="right", padx=5)
@@ -386,62 +505,62 @@ class FileRenamerApp:
                 messagebox.showinfo("No Files Found", f"No {ext} files found in the selected folder.")
                 return
 
-            data = []
-            for idx, fpath in enumerate(files, start=1):
-                fname = os.path.basename(fpath)
-                base = os.path.splitext(fname)[0]
-                data.append({
-                    "Row": idx,
-                    "Current_Filename": fname,
-                    "Prefix": f"{idx:03d}",
-                    "New_Filename": base,
-                    "Notes": ""
-                })
-            df = pd.DataFrame(data)
+            # Build column-wise: one list per column instead of a dict per row
+            names = [os.path.basename(p) for p in files]
+            df = pd.DataFrame({
+                "Row": np.arange(1, len(names) + 1),
+                "Current_Filename": names,
+                "Prefix": [f"{i:03d}" for i in range(1, len(names) + 1)],
+                "New_Filename": [os.path.splitext(n)[0] for n in names],
+                "Notes": ""
+            })
             timestamp = datetime.now().strftime("%Y%m%d")
             default_name = f"sheet-index-{timestamp}.xlsx"
             save_path = filedialog.asksaveasfilename(title="Save Template", defaultextension=".xlsx", initialfile=default_name, filetypes=[("Excel files","*.xlsx")])
             if not save_path:
                 return
 
-            with pd.ExcelWriter(save_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Rename Index', index=False)
+            # xlsxwriter streams rows to disk in constant_memory mode; URL/formula
+            # detection is switched off so filenames are always written as plain text
+            options = {'constant_memory': True, 'strings_to_formulas': False, 'strings_to_urls': False}
+            with pd.ExcelWriter(save_path, engine='xlsxwriter', engine_kwargs={'options': options}) as writer:
+                # constant_memory needs rows written in order, but df.to_excel writes
+                # column by column - so the Rename Index sheet is written row-wise here
+                worksheet = writer.book.add_worksheet('Rename Index')
+                header_format = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center'})
+                worksheet.write_row(0, 0, df.columns, header_format)
+                for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                    worksheet.write_row(r, 0, row)
+
+                for i, col in enumerate(df.columns):
+                    max_length = max(int(df[col].astype(str).str.len().max()), len(col))
+                    worksheet.set_column(i, i, min(max_length + 2, 50))
+
                 instructions = [
-                    ["FILE RENAMER PRO V9 - INSTRUCTIONS"],
-                    [""],
-                    ["CRITICAL: Column B (Current_Filename) is used to match files!"],
-                    [""],
-                    ["HOW TO USE:"],
-                    ["1. Edit columns C, D, E as needed"],
-                    ["2. Column B: Current_Filename (MUST match existing file)"],
-                    ["3. Column C: Prefix (used in Prefix mode)"],
-                    ["4. Column D: New_Filename (primary rename value)"],
-                    ["5. Column E: Notes (logged to file)"],
-                    [""],
-                    ["IMPORTANT: Do not change Column B unless you know what you're doing!"],
-                    ["The program uses Column B to find the correct file to rename."],
-                    [""],
-                    ["Prefix mode: <Prefix><Delimiter><Column D><ext>"],
-                    ["Replace mode: <Column D><ext>"],
-                    [""],
-                    [f"Scanned: {len(files)} files"],
-                    [f"Extension: {ext}"],
-                    [f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}"]
+                    "FILE RENAMER PRO V9 - INSTRUCTIONS",
+                    "",
+                    "CRITICAL: Column B (Current_Filename) is used to match files!",
+                    "",
+                    "HOW TO USE:",
+                    "1. Edit columns C, D, E as needed",
+                    "2. Column B: Current_Filename (MUST match existing file)",
+                    "3. Column C: Prefix (used in Prefix mode)",
+                    "4. Column D: New_Filename (primary rename value)",
+                    "5. Column E: Notes (logged to file)",
+                    "",
+                    "IMPORTANT: Do not change Column B unless you know what you're doing!",
+                    "The program uses Column B to find the correct file to rename.",
+                    "",
+                    "Prefix mode: <Prefix><Delimiter><Column D><ext>",
+                    "Replace mode: <Column D><ext>",
+                    "",
+                    f"Scanned: {len(files)} files",
+                    f"Extension: {ext}",
+                    f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
                 ]
-                inst_df = pd.DataFrame(instructions)
-                inst_df.to_excel(writer, sheet_name='Instructions', index=False, header=False)
-
-                worksheet = writer.sheets['Rename Index']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if cell.value and len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except Exception:
-                            pass
-                    worksheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
+                inst_sheet = writer.book.add_worksheet('Instructions')
+                for r, line in enumerate(instructions):
+                    inst_sheet.write_string(r, 0, line)
 
             self.excel_path_var.set(save_path)
             self.clear_excel_cache()  # Clear cache
@@ -475,28 +594,64 @@ class FileRenamerApp:
             with pd.ExcelWriter(path, engine='openpyxl') as writer:
                 df.to_excel(writer, sheet_name='Rename Index', index=False)
                 instructions = [
-                    ["FILE RENAMER PRO V9 - BLANK TEMPLATE"],
-                    ["Fill Column B with exact filenames that exist in your folder!"]
+                    "FILE RENAMER PRO V9 - BLANK TEMPLATE",
+                    "Fill Column B with exact filenames that exist in your folder!"
                 ]
-                pd.DataFrame(instructions).to_excel(writer, sheet_name='Instructions', index=False, header=False)
+                inst_sheet = writer.book.create_sheet('Instructions')
+                for r, line in enumerate(instructions, start=1):
+                    inst_sheet.cell(row=r, column=1, value=line)
             self.status_var.set("Blank template created")
             messagebox.showinfo("Template Created", f"Blank template saved:\n{path}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not save file:\n{e}")
 
     def validate_inputs(self):
+        """Validate the form and parse the template; returns the 'Rename Index' DataFrame or None"""
         excel_path = self.excel_path_var.get().strip()
         target_folder = self.target_folder_var.get().strip()
         ext = self.file_ext.get().strip()
 
+        # Nothing changed since the last successful validation - skip the checks
+        sig = self.get_inputs_signature(excel_path, target_folder)
+        if sig is None or sig != self._validated_sig:
+            excel_path = self.check_inputs(excel_path, target_folder, ext)
+            if not excel_path:
+                return None
+
+        # One parse serves both the checks and the caller; read_excel_safe also
+        # checks that the file is accessible (not locked)
+        try:
+            df = self.read_excel_safe(excel_path)
+        except PermissionError as e:
+            messagebox.showerror("Excel File Locked", str(e))
+            return None
+        except KeyError:
+            messagebox.showerror("Error", "The Excel file must contain a sheet named 'Rename Index'.")
+            return None
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read Excel file: {e}")
+            return None
+
+        self._validated_sig = self.get_inputs_signature(excel_path, target_folder)
+        return df
+
+    def get_inputs_signature(self, excel_path, target_folder):
+        """(excel mtime, folder mtime), or None if either can't be stat'ed"""
+        try:
+            return (os.stat(excel_path).st_mtime_ns, os.stat(target_folder).st_mtime_ns)
+        except (OSError, ValueError):
+            return None
+
+    def check_inputs(self, excel_path, target_folder, ext):
+        """Check folder, template path and extension; returns the (possibly auto-pulled) Excel path or None"""
         if not target_folder or not os.path.isdir(target_folder):
             messagebox.showerror("Error", "Please select a valid target folder.")
-            return False
+            return None
 
         # Validate paths are local
         if not self.validate_local_path(target_folder):
             messagebox.showerror("Security Error", "Invalid or unsafe folder path.")
-            return False
+            return None
 
         if (not excel_path) and self.auto_pull_var.get():
             latest = self.find_latest_template(target_folder)
@@ -508,140 +663,157 @@ class FileRenamerApp:
 
         if not excel_path or not os.path.isfile(excel_path):
             messagebox.showerror("Error", "Please select a valid Excel file.")
-            return False
+            return None
 
         if not self.validate_local_path(excel_path):
             messagebox.showerror("Security Error", "Invalid or unsafe Excel file path.")
-            return False
+            return None
 
         if not ext.startswith("."):
             messagebox.showerror("Error", "File extension must start with a dot, e.g. .pdf")
-            return False
-
-        # Check if Excel file is accessible
-        available, error_msg = self.check_excel_available(excel_path)
-        if not available:
-            messagebox.showerror("Excel File Locked", error_msg)
-            return False
-
-        try:
-            xl = pd.ExcelFile(excel_path)
-            if 'Rename Index' not in xl.sheet_names:
-                messagebox.showerror("Error", "The Excel file must contain a sheet named 'Rename Index'.")
-                return False
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not read Excel file: {e}")
-            return False
+            return None
 
-        return True
+        return excel_path
 
     def find_latest_template(self, folder):
         """Find latest template in folder - local operation only"""
         try:
-            candidates = glob.glob(os.path.join(folder, "sheet-index-*.xlsx"))
-            if not candidates:
-                candidates = glob.glob(os.path.join(folder, "*.xlsx"))
+            # One directory pass; DirEntry.stat() is cached so each file costs one stat at most
+            entries = []
+            with os.scandir(folder) as it:
+                for e in it:
+                    name = e.name.lower()
+                    if name.endswith(".xlsx") and not name.startswith(".") and e.is_file():
+                        entries.append((name.startswith("sheet-index-"), e.stat().st_mtime, e.path))
+            candidates = [e for e in entries if e[0]] or entries
             if not candidates:
                 return None
-            candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-            for c in candidates:
-                try:
-                    xl = pd.ExcelFile(c)
-                    if 'Rename Index' in xl.sheet_names:
-                        return c
-                except Exception:
-                    continue
+            candidates.sort(key=lambda e: e[1], reverse=True)
+            for _, _, c in candidates:
+                if _has_rename_index(c):
+                    return c
             return None
         except Exception:
             return None
 
     def preview_changes(self):
-        if not self.validate_inputs():
+        if self.rename_in_progress():
+            return
+        df = self.validate_inputs()
+        if df is None:
             return
         try:
-            excel_path = self.excel_path_var.get().strip()
             target_folder = self.target_folder_var.get().strip()
             ext = self.file_ext.get().strip()
             mode = self.mode_var.get()
             recursive = self.recursive_var.get()
             delimiter = self.delimiter_var.get()
 
-            # Read fresh (no cache)
-            df = self.read_excel_safe(excel_path)
             files = self.get_files(target_folder, ext, recursive)
-            files_map = {os.path.basename(p): p for p in files}
+            files_map = self.build_files_map(files)
 
-            preview_win = tk.Toplevel(self.root)
-            preview_win.title("Preview Changes")
-            preview_win.geometry("1000x700")
-            frame = ttk.Frame(preview_win)
-            frame.pack(fill="both", expand=True, padx=10, pady=10)
-            scrollbar = ttk.Scrollbar(frame)
-            scrollbar.pack(side="right", fill="y")
-            text_widget = tk.Text(frame, wrap="none", yscrollcommand=scrollbar.set, font=("Consolas",10))
-            text_widget.pack(side="left", fill="both", expand=True)
-            scrollbar.config(command=text_widget.yview)
+            # Local bindings for the per-row loop below
+            normcase = os.path.normcase
+            _basename = os.path.basename
+            _dirname = os.path.dirname
+            _join = os.path.join
+
+            # Entries of each target directory, listed once on first use: (normcased names,
+            # lower-cased names). The listing includes non-matching files and folders too
+            dir_names = {}
 
-            text_widget.insert("1.0", "═" * 120 + "\n")
-            text_widget.insert("end", "PREVIEW OF CHANGES (V9 - Strict Current_Filename Matching)\n")
-            text_widget.insert("end", "═" * 120 + "\n\n")
-            text_widget.insert("end", f"Total files in folder: {len(files)} | Rows in Excel: {len(df)}\n\n")
-            text_widget.insert("end", "─" * 120 + "\n\n")
+            def target_taken(old_path, parent, new_name):
+                names = dir_names.get(parent)
+                if names is None:
+                    try:
+                        listing = os.listdir(parent)
+                    except OSError:
+                        listing = []
+                    names = dir_names[parent] = (frozenset(map(normcase, listing)),
+                                                 frozenset(n.lower() for n in listing))
+                if normcase(new_name) in names[0]:
+                    return normcase(new_name) != normcase(_basename(old_path))
+                if new_name.lower() in names[1]:
+                    # Differs only by case - a clash on case-insensitive volumes (macOS)
+                    try:
+                        return _target_conflicts(old_path, _join(parent, new_name))
+                    except OSError:
+                        return True
+                return False
+
+            # Build the whole report first; the window is only created once it is ready
+            out = []
+            out.append("═" * 120 + "\n")
+            out.append("PREVIEW OF CHANGES (V9 - Strict Current_Filename Matching)\n")
+            out.append("═" * 120 + "\n\n")
+            out.append(f"Total files in folder: {len(files)} | Rows in Excel: {len(df)}\n\n")
+            out.append("─" * 120 + "\n\n")
 
             changes_count = 0
             missing_files = 0
             collisions = 0
             proposed_new_names = set()
 
-            for idx, row in df.iterrows():
-                rownum = idx + 1
-                current_filename = str(row.get('Current_Filename', '')).strip()
-                prefix = str(row.get('Prefix', '')).strip()
-                new_field = str(row.get('New_Filename', '')).strip()
+            current, prefixes, new_fields = self.get_rename_columns(df, 'Current_Filename', 'Prefix', 'New_Filename')
+            # CRITICAL: Always use Current_Filename to match
+            old_paths = [files_map.get(normcase(c)) for c in current]
+            old_names = [_basename(p) if p else c for c, p in zip(current, old_paths)]
+            new_names = map(self._make_namer(mode, ext, delimiter), prefixes, new_fields, old_names)
 
-                # CRITICAL: Always use Current_Filename to match
+            rows = zip(current, old_paths, old_names, new_names)
+            for rownum, (current_filename, old_path, old_name, new_name) in enumerate(rows, start=1):
                 if not current_filename:
-                    text_widget.insert("end", f"⚠ Row {rownum}: Empty Current_Filename (SKIPPED)\n")
-                    text_widget.insert("end", f"   Fix: Column B must contain the exact existing filename\n\n")
+                    out.append(f"⚠ Row {rownum}: Empty Current_Filename (SKIPPED)\n"
+                               f"   Fix: Column B must contain the exact existing filename\n\n")
                     missing_files += 1
                     continue
 
-                # Try to find file by Current_Filename
-                if current_filename in files_map:
-                    old_path = files_map[current_filename]
-                    old_name = current_filename
-                else:
-                    text_widget.insert("end", f"⚠ Row {rownum}: File not found: '{current_filename}'\n")
-                    text_widget.insert("end", f"   Check: Does this exact filename exist in the target folder?\n\n")
+                if old_path is None:
+                    out.append(f"⚠ Row {rownum}: File not found: '{current_filename}'\n"
+                               f"   Check: Does this exact filename exist in the target folder?\n\n")
                     missing_files += 1
                     continue
 
-                new_name = self.generate_new_name(row, old_name, mode, ext, delimiter)
-
                 if old_name != new_name:
-                    if new_name in proposed_new_names or os.path.exists(os.path.join(os.path.dirname(old_path), new_name)):
+                    parent = _dirname(old_path)
+                    target = normcase(_join(parent, new_name))
+                    if target in proposed_new_names or target_taken(old_path, parent, new_name):
                         collisions += 1
-                        text_widget.insert("end", f"{rownum:3d}. BEFORE: {old_name}\n")
-                        text_widget.insert("end", f"     AFTER:  {new_name}\n")
-                        text_widget.insert("end", f"     ⚠ WARNING: Target name collision detected\n\n")
+                        out.append(f"{rownum:3d}. BEFORE: {old_name}\n"
+                                   f"     AFTER:  {new_name}\n"
+                                   f"     ⚠ WARNING: Target name collision detected\n\n")
                     else:
-                        text_widget.insert("end", f"{rownum:3d}. BEFORE: {old_name}\n")
-                        text_widget.insert("end", f"     AFTER:  {new_name}\n\n")
-                        proposed_new_names.add(new_name)
+                        out.append(f"{rownum:3d}. BEFORE: {old_name}\n"
+                                   f"     AFTER:  {new_name}\n\n")
+                        proposed_new_names.add(target)
                     changes_count += 1
                 else:
-                    text_widget.insert("end", f"{rownum:3d}. (no change) {old_name}\n\n")
+                    out.append(f"{rownum:3d}. (no change) {old_name}\n\n")
 
-            text_widget.insert("end", "─" * 120 + "\n")
-            text_widget.insert("end", f"\nSummary: {changes_count} file(s) will be renamed\n")
+            out.append("─" * 120 + "\n")
+            out.append(f"\nSummary: {changes_count} file(s) will be renamed\n")
             if missing_files:
-                text_widget.insert("end", f"⚠ Missing/Unmatched files: {missing_files}\n")
-                text_widget.insert("end", f"  Action: Check Column B (Current_Filename) matches exact filenames\n")
+                out.append(f"⚠ Missing/Unmatched files: {missing_files}\n")
+                out.append(f"  Action: Check Column B (Current_Filename) matches exact filenames\n")
             if collisions:
-                text_widget.insert("end", f"⚠ Collisions: {collisions} (resolve before running)\n")
+                out.append(f"⚠ Collisions: {collisions} (resolve before running)\n")
             if changes_count == 0:
-                text_widget.insert("end", "\n⚠ No files will be renamed. Check Column B values!\n")
+                out.append("\n⚠ No files will be renamed. Check Column B values!\n")
 
+            # Keep the window hidden while it is populated so Tk lays it out once
+            preview_win = tk.Toplevel(self.root)
+            preview_win.withdraw()
+            preview_win.title("Preview Changes")
+            preview_win.geometry("1000x700")
+            frame = ttk.Frame(preview_win)
+            frame.pack(fill="both", expand=True, padx=10, pady=10)
+            scrollbar = ttk.Scrollbar(frame)
+            scrollbar.pack(side="right", fill="y")
+            text_widget = tk.Text(frame, wrap="none", undo=False, yscrollcommand=scrollbar.set, font=("Consolas",10))
+            text_widget.pack(side="left", fill="both", expand=True)
+            scrollbar.config(command=text_widget.yview)
+
+            text_widget.insert("1.0", "".join(out))
             text_widget.config(state="disabled")
 
             btn_frame = ttk.Frame(preview_win)
@@ -652,12 +824,8 @@ class FileRenamerApp:
             elif missing_files > 0:
                 ttk.Label(btn_frame, text="⚠ Fix missing files before running", foreground="red").pack(side="left", padx=10)
 
-            # CRITICAL: Clear cache after preview
-            self.clear_excel_cache()
+            preview_win.deiconify()
 
-        except PermissionError as e:
-            messagebox.showerror("Excel File Locked", str(e))
-            self.clear_excel_cache()
         except Exception as e:
             messagebox.showerror("Preview Error", f"Could not generate preview:\n{e}")
             self.clear_excel_cache()
@@ -665,49 +833,93 @@ class FileRenamerApp:
     def get_files(self, folder, ext, recursive=False):
         """Get files from folder - local operation only"""
         files = []
+        ext_lower = ext.lower()  # extension matches in any case (.pdf, .PDF, .Pdf)
         try:
+            # DirEntry carries the file type from the directory listing, so
+            # is_file()/is_dir() don't need an extra stat per entry
             if recursive:
-                for root, dirs, filenames in os.walk(folder):
-                    for f in filenames:
-                        if f.endswith(ext):
-                            files.append(os.path.join(root, f))
+                pending = [folder]
+                while pending:
+                    try:
+                        it = os.scandir(pending.pop())
+                    except OSError:
+                        continue  # unreadable subfolder - skipped, as os.walk did
+                    with it:
+                        for e in it:
+                            if e.is_dir(follow_symlinks=False):
+                                pending.append(e.path)
+                            elif e.name.lower().endswith(ext_lower) and e.is_file():
+                                files.append(e.path)
             else:
-                files = [os.path.join(folder, f) for f in os.listdir(folder) 
-                        if f.endswith(ext) and os.path.isfile(os.path.join(folder, f))]
+                with os.scandir(folder) as it:
+                    files = [e.path for e in it if e.name.lower().endswith(ext_lower) and e.is_file()]
             files.sort()
         except Exception:
             pass
         return files
 
-    def generate_new_name(self, row, old_name, mode, ext, delimiter):
-        """Generate new filename based on mode and columns"""
-        prefix = str(row.get('Prefix', '')).strip()
-        new_field = str(row.get('New_Filename', '')).strip()
-
-        if mode == "Prefix":
-            if prefix:
-                if new_field:
-                    base = new_field
-                else:
-                    base = os.path.splitext(old_name)[0]
-                new_base = f"{prefix}{delimiter}{base}" if delimiter is not None else f"{prefix}{base}"
-            else:
-                if new_field:
-                    new_base = new_field
-                else:
-                    new_base = os.path.splitext(old_name)[0]
-        else:  # Replace
-            if new_field:
-                new_base = new_field
+    def build_files_map(self, files):
+        """Map filename -> full path for matching Column B (normcase keys: case-insensitive on Windows)"""
+        normcase = os.path.normcase
+        basename = os.path.basename
+        return {normcase(basename(p)): p for p in files}
+
+    def get_rename_columns(self, df, *columns):
+        """Return the requested columns as stripped object arrays ('' when a column is missing)"""
+        arrays = []
+        for col in columns:
+            if col in df.columns:
+                arrays.append(df[col].astype(str).str.strip().to_numpy(dtype=object))
             else:
-                new_base = os.path.splitext(old_name)[0]
+                arrays.append(np.full(len(df), "", dtype=object))
+        return arrays
 
-        if not new_base.endswith(ext):
-            return new_base + ext
-        return new_base
+    def _make_namer(self, mode, ext, delimiter):
+        """Return namer(prefix, new_field, old_name) -> new filename for this mode"""
+        splitext = os.path.splitext
+        cut = len(ext)
+        ext_lower = ext.lower()
+
+        def split_old(old_name):
+            """(base, suffix) of an existing filename"""
+            if cut and old_name.lower().endswith(ext_lower):
+                return old_name[:-cut], old_name[-cut:]
+            return splitext(old_name)[0], ext
+
+        def with_ext(base, suffix):
+            return base if base.lower().endswith(ext_lower) else base + suffix
+
+        if mode == "Prefix":
+            if delimiter:
+                def prefix_with_delim(prefix, new_field, old_name):
+                    old_base, suffix = split_old(old_name)
+                    base = new_field or old_base
+                    return with_ext(f"{prefix}{delimiter}{base}" if prefix else base, suffix)
+                return prefix_with_delim
+
+            def prefix_nodelim(prefix, new_field, old_name):
+                old_base, suffix = split_old(old_name)
+                return with_ext(prefix + (new_field or old_base), suffix)
+            return prefix_nodelim
+
+        def replace(prefix, new_field, old_name):
+            old_base, suffix = split_old(old_name)
+            return with_ext(new_field or old_base, suffix)
+        return replace
+
+    def rename_in_progress(self):
+        """Tell the user and return True while a rename has not finished yet"""
+        if self._progress_queue is None:
+            return False
+        messagebox.showinfo("Rename In Progress", "A rename is still running.\n\nPlease wait for it to finish.")
+        return True
 
     def on_continue(self):
-        if not self.validate_inputs():
+        if self.rename_in_progress():
+            return
+
+        df = self.validate_inputs()
+        if df is None:
             return
 
         excel_path = self.excel_path_var.get().strip()
@@ -715,57 +927,129 @@ class FileRenamerApp:
         ext = self.file_ext.get().strip()
         mode = self.mode_var.get()
         delimiter = self.delimiter_var.get()
+        recursive = self.recursive_var.get()
+        backup = self.backup_var.get()
+        fast_backup = self.fast_backup_var.get()
+        dry_run = self.dry_run_var.get()
 
-        if not self.dry_run_var.get():
+        if not dry_run:
             if not messagebox.askyesno("Confirm Rename", "⚠ Are you sure you want to rename the files?\n\nThis cannot be undone unless you created a backup."):
                 return
 
         self.save_config()
-        log_path = self.rename_files_from_excel(excel_path, target_folder, ext, mode, delimiter)
 
-        if log_path:
-            if self.dry_run_var.get():
+        # Tk is not thread-safe: the worker only uses the values captured above and
+        # reports back through the queue, which is drained on the UI thread
+        self._progress_queue = queue.Queue()
+        self._rename_thread = threading.Thread(
+            target=self._rename_worker,
+            args=(self._progress_queue, df, excel_path, target_folder, ext, mode, delimiter, recursive, backup, fast_backup, dry_run),
+            daemon=True)
+        self.btn_run.config(state="disabled")
+        self.status_var.set("Renaming...")
+        self._rename_thread.start()
+        self.root.after(50, self._drain_progress_queue)
+
+    def _drain_progress_queue(self):
+        """Apply queued worker messages on the UI thread; keeps polling until the worker finishes"""
+        latest = None
+        try:
+            while True:
+                msg = self._progress_queue.get_nowait()
+                if msg[0] == "progress":
+                    latest = msg  # only the newest progress value matters
+                else:
+                    self._finish_rename(msg)
+                    return
+        except queue.Empty:
+            pass
+        if latest is not None:
+            self.show_progress(latest[1], latest[2])
+        self.root.after(50, self._drain_progress_queue)
+
+    def _finish_rename(self, msg):
+        self._progress_queue = None
+        self.hide_progress()
+        self.btn_run.config(state="normal")
+        if msg[0] == "done":
+            _, log_path, dry_run = msg
+            if dry_run:
                 messagebox.showinfo("Dry Run Complete", f"Preview complete. No files were renamed.\n\nLog: {log_path}")
             else:
                 messagebox.showinfo("✓ Success", f"Renaming complete!\n\nLog: {log_path}")
             self.status_var.set("✓ Operation completed successfully")
+        else:
+            _, title, text = msg
+            self.clear_excel_cache()
+            self.status_var.set("Rename failed")
+            messagebox.showerror(title, text)
 
     def show_progress(self, current, total):
-        """Update inline progress bar"""
+        """Update inline progress bar (called at most every 50 ms from _drain_progress_queue)"""
+        if total != self._progress_total:
+            # Reconfiguring and re-gridding is only needed when a run starts
+            self.progress_bar['maximum'] = total
+            self.progress_frame.grid()
+            self._progress_total = total
         self.progress_var.set(current)
-        self.progress_bar['maximum'] = total
-        self.progress_frame.grid()
         self.root.update_idletasks()
 
     def hide_progress(self):
         """Hide inline progress bar"""
         self.progress_frame.grid_remove()
         self.progress_var.set(0)
+        self._progress_total = None
         self.root.update_idletasks()
 
-    def rename_files_from_excel(self, excel_path, target_folder, ext, mode, delimiter):
-        """Rename files - all operations local only"""
+    def _rename_worker(self, progress_q, df, excel_path, target_folder, ext, mode, delimiter, recursive, backup, fast_backup, dry_run):
+        """Rename files - all operations local only. Background thread: reports via progress_q, never touches Tk"""
         try:
-            # Read fresh (no cache)
-            df = self.read_excel_safe(excel_path)
-            recursive = self.recursive_var.get()
             files = self.get_files(target_folder, ext, recursive)
-            files_map = {os.path.basename(p): p for p in files}
-
-            # Pre-scan for planned renames
-            planned = 0
-            for idx, row in df.iterrows():
-                current_filename = str(row.get('Current_Filename', '')).strip()
-                if not current_filename or current_filename not in files_map:
+            files_map = self.build_files_map(files)
+            normcase = os.path.normcase
+
+            # Strip and convert each column once; the planning pass below just zips the arrays
+            columns = self.get_rename_columns(df, *RENAME_COLUMNS)
+
+            # Per-row log lines, formatted through templates built once
+            ok_line = "✓ {}\n  → {}\n".format
+            note_line = "  User Note: {}\n".format
+            err_line = "✗ {}\n  ERROR: {}\n\n".format
+            exists_line = "✗ {}\n  ERROR: Target exists: {}\n\n".format
+            skip_line = "○ {} (no change)\n".format
+            empty_line = "⚠ Row {}: Empty Current_Filename (skipped)\n".format
+            missing_line = "⚠ Row {}: File not found: '{}' (skipped)\n".format
+
+            namer = self._make_namer(mode, ext, delimiter)
+            dirname = os.path.dirname
+            join = os.path.join
+
+            # One pass over the sheet: rows that need a rename go into plan, every
+            # other row is logged as skipped up front
+            plan = []
+            skipped_lines = []
+            for rownum, (current_filename, prefix, new_field, notes) in enumerate(zip(*columns), start=1):
+                # CRITICAL: Only process if Current_Filename exists and matches
+                if not current_filename:
+                    skipped_lines.append(empty_line(rownum))
                     continue
-                old_name = current_filename
-                new_name = self.generate_new_name(row, old_name, mode, ext, delimiter)
-                if old_name != new_name:
-                    planned += 1
+                old_path = files_map.get(normcase(current_filename))
+                if old_path is None:
+                    skipped_lines.append(missing_line(rownum, current_filename))
+                    continue
+                old_name = os.path.basename(old_path)
+                new_name = namer(prefix, new_field, old_name)
+                if old_name == new_name:
+                    skipped_lines.append(skip_line(old_name))
+                    continue
+                # Without recursion every file sits directly in target_folder
+                parent = dirname(old_path) if recursive else target_folder
+                plan.append((rownum, old_path, old_name, join(parent, new_name), new_name, notes))
+            planned = len(plan)
 
             # Create backup
-            if self.backup_var.get() and not self.dry_run_var.get():
-                backup_folder = self.create_backup(target_folder, files)
+            if backup and not dry_run:
+                backup_folder = self.create_backup(target_folder, files, hardlink=fast_backup)
                 backup_msg = f"Backup: {backup_folder}\n\n"
             else:
                 backup_msg = ""
@@ -774,125 +1058,134 @@ class FileRenamerApp:
             log_filename = f"rename_log_{timestamp}.txt"
             log_path = os.path.join(target_folder, log_filename)
 
-            # Calculate step delay
-            if planned > 0:
-                step_delay = max(0.02, min(0.05, 2.0 / planned))
-            else:
-                step_delay = 0.02
+            # Redraw progress every ~0.5% of the work or every 50 ms, whichever comes first
+            progress_every = max(1, planned // 200)
+            last_ui = time.monotonic()
 
             renamed_count = 0
             error_count = 0
-            skipped_count = 0
+            skipped_count = len(skipped_lines)
             processed_steps = 0
 
+            # Log collected in memory and written once (also if the loop fails part-way)
+            log = []
+            write = log.append
             with open(log_path, "w", encoding="utf-8") as log_file:
-                log_file.write("FILE RENAMER PRO V9 - Log File\n")
-                log_file.write("=" * 70 + "\n")
-                log_file.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                log_file.write(f"Excel: {excel_path}\n")
-                log_file.write(f"Target: {target_folder}\n")
-                log_file.write(f"Mode: {mode} | Delimiter: '{delimiter}' | Extension: {ext}\n")
-                log_file.write(f"Matching: Strict Current_Filename (Column B) matching\n")
-                log_file.write(f"{backup_msg}\n")
-                log_file.write("=" * 70 + "\n\n")
-
-                if planned > 0:
-                    self.show_progress(0, planned)
-
-                for idx, row in df.iterrows():
-                    rownum = idx + 1
-                    current_filename = str(row.get('Current_Filename', '')).strip()
-                    notes = str(row.get('Notes', '')).strip()
-
-                    # CRITICAL: Only process if Current_Filename exists and matches
-                    if not current_filename:
-                        log_file.write(f"⚠ Row {rownum}: Empty Current_Filename (skipped)\n")
-                        skipped_count += 1
-                        continue
-
-                    if current_filename not in files_map:
-                        log_file.write(f"⚠ Row {rownum}: File not found: '{current_filename}' (skipped)\n")
-                        skipped_count += 1
-                        continue
-
-                    old_path = files_map[current_filename]
-                    old_name = current_filename
-
-                    new_name = self.generate_new_name(row, old_name, mode, ext, delimiter)
-                    new_path = os.path.join(os.path.dirname(old_path), new_name)
-
-                    if old_name == new_name:
-                        log_file.write(f"○ {old_name} (no change)\n")
-                        skipped_count += 1
-                        continue
-
-                    if os.path.exists(new_path) and not (os.path.exists(new_path) and os.path.samefile(old_path, new_path)):
-                        log_file.write(f"✗ {old_name}\n")
-                        log_file.write(f"  ERROR: Target exists: {new_name}\n\n")
-                        error_count += 1
-                        if planned > 0:
+                try:
+                    write("FILE RENAMER PRO V9 - Log File\n")
+                    write("=" * 70 + "\n")
+                    write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+                    write(f"Excel: {excel_path}\n")
+                    write(f"Target: {target_folder}\n")
+                    write(f"Mode: {mode} | Delimiter: '{delimiter}' | Extension: {ext}\n")
+                    write(f"Matching: Strict Current_Filename (Column B) matching\n")
+                    write(f"{backup_msg}\n")
+                    write("=" * 70 + "\n\n")
+
+                    log.extend(skipped_lines)
+                    if skipped_lines:
+                        write("\n")
+
+                    if planned > 0:
+                        progress_q.put(("progress", 0, planned))
+
+                    # A dry run has to detect collisions up front, nothing else will
+                    trust_rename = _RENAME_REFUSES_OVERWRITE and not dry_run
+                    rename_fn = (lambda old, new: None) if dry_run else _safe_rename
+
+                    for rownum, old_path, old_name, new_path, new_name, notes in plan:
+                        # An earlier row may already have renamed this file
+                        if files_map.get(normcase(old_name)) != old_path:
+                            write(missing_line(rownum, old_name))
+                            skipped_count += 1
                             processed_steps += 1
-                            self.show_progress(processed_steps, planned)
-                            time.sleep(step_delay)
-                        continue
+                            continue
 
-                    try:
-                        if not self.dry_run_var.get():
-                            os.rename(old_path, new_path)
-
-                        log_file.write(f"✓ {old_name}\n")
-                        log_file.write(f"  → {new_name}\n")
-                        if notes:
-                            log_file.write(f"  User Note: {notes}\n")
-                        log_file.write("\n")
-
-                        renamed_count += 1
-                        files_map.pop(old_name, None)
-                        files_map[new_name] = new_path
-                    except Exception as e:
-                        log_file.write(f"✗ {old_name}\n")
-                        log_file.write(f"  ERROR: {e}\n\n")
-                        error_count += 1
+                        try:
+                            # files_map holds every matching file under its current name, so most
+                            # collisions are answered by the dict without touching the disk
+                            hit = files_map.get(normcase(new_name))
+                            if hit is None:
+                                # Only a file the listing skipped can be in the way
+                                conflict = not trust_rename and _target_conflicts(old_path, new_path)
+                            elif hit == old_path:
+                                conflict = False  # case-only change of the same file
+                            elif recursive:
+                                # Same name, but possibly in a different subfolder
+                                conflict = _target_conflicts(old_path, new_path)
+                            else:
+                                conflict = True
+                            if conflict:
+                                raise FileExistsError(new_path)
+
+                            rename_fn(old_path, new_path)
+
+                            write(ok_line(old_name, new_name))
+                            if notes:
+                                write(note_line(notes))
+                            write("\n")
+
+                            renamed_count += 1
+                            files_map.pop(normcase(old_name), None)
+                            files_map[normcase(new_name)] = new_path
+                        except FileExistsError:
+                            write(exists_line(old_name, new_name))
+                            error_count += 1
+                        except Exception as e:
+                            write(err_line(old_name, e))
+                            error_count += 1
 
-                    if planned > 0:
                         processed_steps += 1
-                        self.show_progress(processed_steps, planned)
-                        time.sleep(step_delay)
+                        if processed_steps % progress_every == 0 or time.monotonic() - last_ui > 0.05:
+                            progress_q.put(("progress", processed_steps, planned))
+                            last_ui = time.monotonic()
 
-                log_file.write("\n" + "=" * 70 + "\n")
-                log_file.write("SUMMARY\n")
-                log_file.write("=" * 70 + "\n")
-                log_file.write(f"Renamed: {renamed_count} | Errors: {error_count} | Skipped: {skipped_count}\n")
-                log_file.write(f"Total processed: {renamed_count + error_count + skipped_count}\n")
+                    write("\n" + "=" * 70 + "\n")
+                    write("SUMMARY\n")
+                    write("=" * 70 + "\n")
+                    write(f"Renamed: {renamed_count} | Errors: {error_count} | Skipped: {skipped_count}\n")
+                    write(f"Total processed: {renamed_count + error_count + skipped_count}\n")
+                finally:
+                    log_file.write("".join(log))
 
-            self.hide_progress()
-            
-            # CRITICAL: Clear cache after operation
-            self.clear_excel_cache()
-
-            return log_path
+            progress_q.put(("done", log_path, dry_run))
 
         except PermissionError as e:
-            self.hide_progress()
-            self.clear_excel_cache()
-            messagebox.showerror("Excel File Locked", str(e))
-            return None
+            # The sheet was read before the worker started, so this is the backup
+            # folder or the log file in the target folder
+            progress_q.put(("error", "Permission Denied",
+                            f"Cannot write to the target folder:\n{e}\n\nCheck that the folder is not read-only and that you have write access to it."))
         except Exception as e:
-            self.hide_progress()
-            self.clear_excel_cache()
-            messagebox.showerror("Error", f"An error occurred:\n{e}")
-            return None
+            progress_q.put(("error", "Error", f"An error occurred:\n{e}"))
 
-    def create_backup(self, target_folder, files):
-        """Create backup - local operation only"""
+    def create_backup(self, target_folder, files, hardlink=False):
+        """Create backup - local operation only (hardlink=True links instead of copying where possible)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_folder = os.path.join(target_folder, f"backup_{timestamp}")
         os.makedirs(backup_folder, exist_ok=True)
-        for f in files:
+
+        def copy_one(item):
+            name, f = item
+            dst = os.path.join(backup_folder, name)
+            if hardlink:
+                try:
+                    os.link(f, dst)
+                    return
+                except OSError:
+                    pass  # cross-device or unsupported - copy instead
             try:
-                shutil.copy2(f, os.path.join(backup_folder, os.path.basename(f)))
+                shutil.copy2(f, dst)
             except Exception:
                 pass
+
+        # One copy per backup name (the last file wins, as with sequential copying),
+        # so no two threads ever write the same destination
+        targets = {os.path.basename(f): f for f in files}
+
+        # Copies are I/O-bound, so several in flight keep the disk busy. shutil.copy2
+        # already uses the OS fast-copy path (CopyFile2 on Windows, sendfile on Linux)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+            pool.map(copy_one, targets.items())
         return backup_folder
 
     def show_help(self):
@@ -932,6 +1225,12 @@ WORKFLOW:
 5. Preview changes
 6. Run rename
 
+BACKUPS:
+- "Create backup" copies every file into a backup_<timestamp> folder first
+- "Fast backup" hardlinks instead of copying: instant and uses no extra space
+- A hardlinked backup shares the file's contents - editing a file afterwards
+  also changes its backup (renaming does not)
+
 RENAME MODES:
 - Prefix: <Column C><Delimiter><Column D><ext>
 - Replace: <Column D><ext>
@@ -952,6 +1251,9 @@ Wrong files renamed → Did you modify Column B incorrectly?
         ttk.Button(help_win, text="Close", command=help_win.destroy).pack(pady=8)
 
     def on_quit(self):
+        if self._progress_queue is not None:
+            messagebox.showwarning("Rename In Progress", "Please wait for the current rename to finish before exiting.")
+            return
         self.clear_excel_cache()  # Clear cache on exit
         self.save_config()
         self.root.destroy()